@@ -1,7 +1,6 @@
 """API implementation for Sengled"""
 import asyncio
 from http import HTTPStatus
-import json
 import logging
 import ssl
 from typing import Any
@@ -10,8 +9,9 @@ import uuid
 
 import aiohttp
 import asyncio_mqtt as mqtt
+import orjson
 
-from homeassistant.const import Platform
+from homeassistant.const import CONF_DEVICES, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.typing import DiscoveryInfoType
 from homeassistant.helpers.discovery import load_platform
@@ -21,6 +21,11 @@ from .api_bulb import APIBulb
 
 _LOGGER = logging.getLogger(__name__)
 
+TOPIC_PREFIX = "wifielement/"
+
+# Seconds to wait before each MQTT connection retry
+MQTT_RETRY_DELAYS = (0.2, 0.5, 1.5)
+
 
 class AuthError(Exception):
     """Exception raised for authentication errors."""
@@ -33,7 +38,9 @@ class API:
     _jbalancer_url: parse.ParseResult | None = None
     _jsession_id: str | None = None
     _lights: dict[str, APIBulb]
+    _lights_by_topic: dict[str, APIBulb]
     _mqtt: mqtt.Client | None = None
+    _tls_context: ssl.SSLContext | None = None
 
     def __init__(self, hass: HomeAssistant, username: str, password: str) -> None:
         self._hass = hass
@@ -41,14 +48,30 @@ class API:
         self._password = password
 
         self._lights = {}
-        self._lights_mutex = asyncio.Lock()
+        self._lights_by_topic = {}
+        self._topic_handlers = {
+            "status": self._handle_status,
+            "update": self._handle_update,
+        }
         self._cookiejar = aiohttp.CookieJar()
-        self._http = aiohttp.ClientSession(cookie_jar=self._cookiejar)
+        # One pooled session for all cloud calls, keeping connections alive
+        # between login, server info and discovery
+        self._http = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=10, ttl_dns_cache=300, keepalive_timeout=75
+            ),
+            cookie_jar=self._cookiejar,
+            timeout=aiohttp.ClientTimeout(total=10),
+        )
 
     @staticmethod
     async def check_auth(username, password):
         """Check if authentication works."""
-        await API(None, username, password)._async_login()
+        api = API(None, username, password)
+        try:
+            await api._async_login()
+        finally:
+            await api._http.close()
 
     async def _async_login(self):
         url = "https://ucenter.cloud.sengled.com/user/app/customer/v2/AuthenCross.json"
@@ -63,7 +86,7 @@ class API:
         }
 
         try:
-            async with self._http.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+            async with self._http.post(url, json=payload) as resp:
                 if resp.status != HTTPStatus.OK:
                     _LOGGER.error(f"Authentication failed with status: {resp.status} and headers: {resp.headers}")
                     raise AuthError(f"HTTP error {resp.status}")
@@ -81,7 +104,7 @@ class API:
         """Get secondary server info from the primary."""
         url = "https://life2.cloud.sengled.com/life2/server/getServerInfo.json"
         try:
-            async with self._http.post(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+            async with self._http.post(url) as resp:
                 if resp.status != HTTPStatus.OK:
                     _LOGGER.error(f"Failed to get server info: HTTP {resp.status}")
                     return
@@ -96,18 +119,22 @@ class API:
     async def _async_setup_mqtt(self):
         """Setup MQTT client with proper TLS context and retry logic."""
 
-        # Create a thread to run blocking I/O for SSL context creation
-        loop = asyncio.get_running_loop()
-        tls_context = await loop.run_in_executor(None, ssl.create_default_context)
+        # Loading the trust store is blocking I/O, so build the SSL context once
+        # in an executor and reuse it for every reconnect
+        if self._tls_context is None:
+            loop = asyncio.get_running_loop()
+            self._tls_context = await loop.run_in_executor(
+                None, ssl.create_default_context
+            )
 
         # Retry logic for the MQTT connection
-        for attempt in range(3):  # Try connecting up to 3 times
+        for attempt in range(len(MQTT_RETRY_DELAYS) + 1):
             try:
                 client = mqtt.Client(
                     self._inception_url.hostname,
                     self._inception_url.port,
                     client_id=f"{self._jsession_id}@lifeApp",
-                    tls_context=tls_context,
+                    tls_context=self._tls_context,
                     transport="websockets",
                     websocket_headers={
                         "Cookie": f"JSESSIONID={self._jsession_id}",
@@ -122,18 +149,15 @@ class API:
                 self._mqtt = client
 
                 # Subscribe the lights to MQTT topics after successful connection
-                async with self._lights_mutex:
-                    lights = tuple(self._lights.values())
-                for light in lights:
-                    await self._subscribe_light(light)
+                await self._subscribe_lights(list(self._lights.values()))
 
                 _LOGGER.info("MQTT client connected and ready on attempt %d", attempt + 1)
                 break  # Exit the retry loop if the connection was successful
 
             except mqtt.error.MqttConnectError as e:
                 _LOGGER.warning(f"MQTT connection attempt {attempt+1} failed: {e}")
-                if attempt < 2:  # Retry with exponential backoff (2, 4 seconds)
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                if attempt < len(MQTT_RETRY_DELAYS):
+                    await asyncio.sleep(MQTT_RETRY_DELAYS[attempt])
                 else:
                     raise  # Re-raise the error if all retries have failed
 
@@ -141,14 +165,16 @@ class API:
         """Get a list of HASS-friendly discovered devices."""
         url = "https://life2.cloud.sengled.com/life2/device/list.json"
         try:
-            async with self._http.post(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+            async with self._http.post(url) as resp:
                 if resp.status != HTTPStatus.OK:
                     _LOGGER.error(f"Failed to discover lights: HTTP {resp.status}")
                     return []
                 data = await resp.json()
 
-                for device in data["deviceList"]:
-                    load_platform(self._hass, Platform.LIGHT, DOMAIN, device, {})
+                # Hand all devices to the platform at once so it can set them up in bulk
+                load_platform(
+                    self._hass, Platform.LIGHT, DOMAIN, {CONF_DEVICES: data["deviceList"]}, {}
+                )
                 _LOGGER.info("API discovery complete")
 
         except aiohttp.ClientError as e:
@@ -165,64 +191,79 @@ class API:
                 await self._async_setup_mqtt()
                 await self._message_loop()
             except mqtt.error.MqttConnectError as conerr:
-                _LOGGER.info(f"MQTT refused, reauthenticating {conerr}")
+                _LOGGER.info("MQTT refused, reauthenticating %s", conerr)
                 await self._async_login()
             except mqtt.MqttError as error:
-                _LOGGER.info(f"MQTT dropped, waiting to reconnect {error}")
+                _LOGGER.info("MQTT dropped, waiting to reconnect %s", error)
                 await asyncio.sleep(10)
 
     async def _message_loop(self):
         """Handle incoming MQTT messages."""
         async with self._mqtt.messages() as messages:
             async for message in messages:
-                if message.topic.matches("wifielement/+/status"):
-                    await self._handle_status(message)
-                elif message.topic.matches("wifielement/+/update"):
-                    pass
+                # Topics are always "wifielement/<light id>/<kind>"
+                topic = message.topic.value
+                handler = None
+                if topic.startswith(TOPIC_PREFIX):
+                    light_id, _, kind = topic[len(TOPIC_PREFIX):].partition("/")
+                    handler = self._topic_handlers.get(kind)
+                if handler:
+                    await handler(light_id, message)
                 else:
                     _LOGGER.warning(f"Dropping unknown message: {message.topic} {message.payload}")
 
-    async def async_register_light(self, light):
-        """Subscribe a light to its updates."""
-        async with self._lights_mutex:
-            self._lights[light.unique_id] = light
-        await self._subscribe_light(light)
+    async def async_register_lights(self, lights):
+        """Subscribe several lights to their updates with a single SUBSCRIBE.
+
+        The registries are copied and swapped rather than mutated, so readers
+        always see a consistent dict without locking.
+        """
+        self._lights = {**self._lights, **{light.unique_id: light for light in lights}}
+        self._lights_by_topic = {
+            **self._lights_by_topic,
+            **{topic: light for light in lights for topic in light.mqtt_topics},
+        }
+        await self._subscribe_lights(lights)
 
-    async def _subscribe_light(self, light):
-        """Subscribe a light to its MQTT topics."""
+    async def _subscribe_lights(self, lights):
+        """Subscribe lights to their MQTT topics with a single SUBSCRIBE."""
         if self._mqtt:
-            for topic in light.mqtt_topics:
-                await self._mqtt.subscribe(topic)
+            topics = [(topic, 0) for light in lights for topic in light.mqtt_topics]
+            if topics:
+                await self._mqtt.subscribe(topics)
 
-    async def async_mqtt_publish(self, topic: str, message: Any):
-        """Send an MQTT update to central control."""
+    async def async_mqtt_publish(self, topic: str, message: Any) -> bool:
+        """Send an MQTT update to central control, returning whether it was sent."""
         try:
             await self._mqtt.publish(
                 topic,
-                payload=json.dumps(message),
+                payload=orjson.dumps(message),
             )
-            _LOGGER.debug(f"MQTT publish: {topic} {message}")
+            _LOGGER.debug("MQTT publish: %s %s", topic, message)
+            return True
         except mqtt.MqttError as e:
             _LOGGER.error(f"Failed to publish MQTT message: {e}")
+            return False
 
-    async def _handle_status(self, msg):
+    async def _handle_status(self, light_id: str, msg):
         """Handle a status message from upstream."""
-        light_id = msg.topic.value.split("/")[1]
-        async with self._lights_mutex:
-            light = self._lights.get(light_id)
+        light = self._lights_by_topic.get(msg.topic.value)
         if not light:
             _LOGGER.warning(f"Status received for unknown light: {light_id}")
             return
 
         try:
-            payload = json.loads(msg.payload)
+            payload = orjson.loads(msg.payload)
             if not isinstance(payload, list):
                 _LOGGER.warning(f"Unexpected status payload: {payload}")
                 return
             light.update_bulb(payload)
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             _LOGGER.error(f"Failed to decode MQTT message: {e}")
 
+    async def _handle_update(self, light_id: str, msg):
+        """Ignore the echo of update commands sent to a light."""
+
     async def shutdown(self):
         """Shutdown and clean up resources."""
         if self._mqtt:
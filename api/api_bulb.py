@@ -1,10 +1,12 @@
 """The interface expected by API."""
-from typing import Any, List, Tuple
+from typing import Any, Optional, Sequence, Tuple
 
 
 class APIBulb:
     """Base class that defines the expected interface for a Sengled Bulb."""
 
+    __slots__ = ()
+
     def update_bulb(self, payload: Any) -> None:
         """Deliver an update packet to the bulb."""
         # This method must be implemented by subclasses to update the bulb's state based on the payload.
@@ -35,8 +37,20 @@ class APIBulb:
         # This method must be implemented by subclasses to adjust the color temperature (in mireds).
         raise NotImplementedError("Bulbs must implement set_temperature")
 
+    async def set_state(
+        self,
+        power: Optional[bool] = None,
+        brightness: Optional[int] = None,
+        rgb: Optional[Tuple[int, int, int]] = None,
+        temp: Optional[int] = None,
+        effect: Optional[str] = None,
+    ) -> bool:
+        """Set several attributes of the bulb in a single command, returning whether it was sent."""
+        # This method must be implemented by subclasses to send all given attributes together.
+        raise NotImplementedError("Bulbs must implement set_state")
+
     @property
-    def mqtt_topics(self) -> List[str]:
-        """Return a list of MQTT topics relevant to the bulb."""
+    def mqtt_topics(self) -> Sequence[str]:
+        """Return the MQTT topics relevant to the bulb."""
         # This method must be implemented by subclasses to define the MQTT topics the bulb listens to.
         raise NotImplementedError("Bulbs must implement mqtt_topics")
@@ -1,7 +1,6 @@
 """Implementations for the Elements series."""
 from __future__ import annotations
 
-import math
 import logging
 import time
 from typing import Any, Final
@@ -28,37 +27,42 @@ HA_COLOR_MODE_BRIGHTNESS = "brightness"
 HA_COLOR_MODE_COLOR_TEMP = "color_temp"
 HA_COLOR_MODE_RGB = "rgb"
 
+_EFFECT_LIST: Final = (
+    "christmas",
+    "colorCycle",
+    "festival",
+    "halloween",
+    "randomColor",
+    "rhythm",
+    "none",
+)
+
+
+# Discovery keys that are not copied as-is, and the value types that are
+_SKIP_KEYS: Final = frozenset({"attributeList"})
+_ALLOWED_TYPES: Final = (list, tuple, str)
+
 
 def _hassify_discovery(packet: dict[str, Any]) -> dict[str, str]:
     result = {}
     for key, value in packet.items():
-        if key in {"attributeList"}:
-            continue
-
-        # Handle None values explicitly
-        if value is None:
-            _LOGGER.debug("Skipping key with None value: %s", key)
-            continue
-
-        if isinstance(value, (list, tuple, str)):
-            result[key] = value
-        else:
+        if isinstance(value, _ALLOWED_TYPES):
+            if key not in _SKIP_KEYS:
+                result[key] = value
+        elif value is not None:
             _LOGGER.warning("Weird value while hass-ifying: %s = %r", key, value)
 
     # Process attributes in attributeList
-    for item in packet.get("attributeList", []):
-        result[item["name"]] = item["value"]
+    result.update((item["name"], item["value"]) for item in packet.get("attributeList", ()))
 
     return result
 
 
-
 def _decode_color_temp(value_pct: str, min_mireds: int, max_mireds: int) -> int:
     """Convert Sengled's brightness percentage to mireds given the light's range."""
     try:
-        return math.ceil(
-            max_mireds - ((int(value_pct) / 100.0) * (max_mireds - min_mireds))
-        )
+        # ceil(max - x) == max - floor(x), done in integers
+        return max_mireds - (int(value_pct) * (max_mireds - min_mireds)) // 100
     except ValueError as e:
         _LOGGER.error(f"Invalid value for color temperature: {value_pct}")
         raise e
@@ -67,7 +71,9 @@ def _decode_color_temp(value_pct: str, min_mireds: int, max_mireds: int) -> int:
 def _encode_color_temp(value_mireds: int, min_mireds: int, max_mireds: int) -> str:
     """Convert color temperature from Home Assistant to Sengled format."""
     try:
-        return str(math.ceil((max_mireds - value_mireds) / (max_mireds - min_mireds) * 100))
+        mired_range = max_mireds - min_mireds
+        # Integer ceiling of (max - value) / range * 100
+        return str(((max_mireds - value_mireds) * 100 + mired_range - 1) // mired_range)
     except ZeroDivisionError as e:
         _LOGGER.error(f"Invalid mired range for color temperature: {min_mireds}-{max_mireds}")
         raise e
@@ -76,31 +82,52 @@ def _encode_color_temp(value_mireds: int, min_mireds: int, max_mireds: int) -> s
 class ElementsBulb(APIBulb):
     """A WiFi Elements bulb that dynamically supports features based on its discovery attributes."""
 
+    __slots__ = (
+        "_data",
+        "_api",
+        "_unique_id",
+        "_status_topic",
+        "_update_topic",
+        "_mqtt_topics",
+        "_supports_brightness",
+        "_supports_color",
+        "_supports_color_temp",
+    )
+
     _data: dict[str, str]
     _api: API  # Expected from mixed-in class
-    _supports_color: bool = False
-    _supports_brightness: bool = False
-    _supports_color_temp: bool = False
+    _supports_color: bool
+    _supports_brightness: bool
+    _supports_color_temp: bool
 
     def __init__(self, discovery: dict[str, Any]) -> None:
         """Initialize the ElementsBulb and determine supported features."""
-        _LOGGER.debug(f"{self.__class__.__name__} init {discovery}")
+        _LOGGER.debug("%s init %s", self.__class__.__name__, discovery)
         self._data = _hassify_discovery(discovery)
 
+        # Identity and topics never change, so build them once
+        self._unique_id = self._data["deviceUuid"]
+        self._status_topic = f"wifielement/{self._unique_id}/status"
+        self._update_topic = f"wifielement/{self._unique_id}/update"
+        self._mqtt_topics = (self._status_topic,)
+
         # Parse the supported attributes
-        support_attributes = self._data.get("supportAttributes", "").split(",")
+        support_attributes = frozenset(self._data.get("supportAttributes", "").split(","))
         self._supports_brightness = "brightness" in support_attributes
         self._supports_color = "color" in support_attributes
         self._supports_color_temp = "colorTemperature" in support_attributes
 
         _LOGGER.info(
-            f"{self.name} supports: brightness={self._supports_brightness}, "
-            f"color={self._supports_color}, color temperature={self._supports_color_temp}"
+            "%s supports: brightness=%s, color=%s, color temperature=%s",
+            self.name,
+            self._supports_brightness,
+            self._supports_color,
+            self._supports_color_temp,
         )
 
     @property
     def unique_id(self) -> str:
-        return self._data["deviceUuid"]
+        return self._unique_id
 
     @property
     def name(self) -> str:
@@ -123,7 +150,7 @@ class ElementsBulb(APIBulb):
             return None
 
         try:
-            return math.ceil(int(self._data[PACKET_BRIGHTNESS]) / 100 * 255)
+            return (int(self._data[PACKET_BRIGHTNESS]) * 255 + 99) // 100
         except (KeyError, ValueError) as e:
             _LOGGER.warning(f"Invalid brightness value: {e}")
             return None
@@ -148,7 +175,8 @@ class ElementsBulb(APIBulb):
             return None
 
         try:
-            return tuple(int(rgb) for rgb in self._data[PACKET_RGB_COLOR].split(":"))
+            red, green, blue = self._data[PACKET_RGB_COLOR].split(":", 2)
+            return (int(red), int(green), int(blue))
         except (ValueError, KeyError) as e:
             _LOGGER.warning(f"Invalid RGB color value: {e}")
             return None
@@ -171,39 +199,46 @@ class ElementsBulb(APIBulb):
 
     # TODO show effects only if available
     @property
-    def effect_list(self) -> list[str] | None:
+    def effect_list(self) -> tuple[str, ...] | None:
         """Return available effects."""
-        return [
-            "christmas",
-            "colorCycle",
-            "festival",
-            "halloween",
-            "randomColor",
-            "rhythm",
-            "none",
-        ]
+        return _EFFECT_LIST
 
     # TODO max_mireds update based on bulb
-    @property
-    def max_mireds(self) -> int:
-        return 400
+    max_mireds: int = 400
 
     # TODO min_mireds update based on bulb
-    @property
-    def min_mireds(self) -> int:
-        return 154
+    min_mireds: int = 154
 
     @property
-    def mqtt_topics(self) -> list[str]:
+    def mqtt_topics(self) -> tuple[str, ...]:
         """Return MQTT topics for the light."""
-        return [
-            f"wifielement/{self.unique_id}/status",
-        ]
+        return self._mqtt_topics
+
+    @staticmethod
+    def _power_update(to_on: bool) -> dict[str, Any]:
+        return {"type": PACKET_SWITCH, "value": PACKET_VALUE_ON if to_on else PACKET_VALUE_OFF}
+
+    @staticmethod
+    def _brightness_update(value: int) -> dict[str, Any]:
+        return {"type": PACKET_BRIGHTNESS, "value": str((value * 100 + 254) // 255)}
+
+    @staticmethod
+    def _color_update(value: tuple[int, int, int]) -> dict[str, Any]:
+        return {"type": PACKET_RGB_COLOR, "value": ":".join(str(v) for v in value)}
+
+    def _temperature_update(self, temp_mireds: int) -> dict[str, Any]:
+        return {
+            "type": PACKET_COLOR_TEMP,
+            "value": _encode_color_temp(temp_mireds, self.min_mireds, self.max_mireds),
+        }
+
+    @staticmethod
+    def _effect_update(effect: str, enable: bool) -> dict[str, Any]:
+        return {"type": effect, "value": PACKET_VALUE_ON if enable else PACKET_VALUE_OFF}
 
     async def set_power(self, to_on: bool = True):
         """Set the power on/off."""
-        value = PACKET_VALUE_ON if to_on else PACKET_VALUE_OFF
-        await self._async_send_updates({"type": PACKET_SWITCH, "value": value})
+        await self._async_send_updates(self._power_update(to_on))
 
     async def set_brightness(self, value: int):
         """Set the brightness level (0-255), if supported."""
@@ -212,9 +247,7 @@ class ElementsBulb(APIBulb):
             return
 
         try:
-            await self._async_send_updates(
-                {"type": PACKET_BRIGHTNESS, "value": str(math.ceil(value / 255 * 100))}
-            )
+            await self._async_send_updates(self._brightness_update(value))
         except ValueError as e:
             _LOGGER.error(f"Failed to set brightness: {e}")
 
@@ -225,9 +258,7 @@ class ElementsBulb(APIBulb):
             return
 
         try:
-            await self._async_send_updates(
-                {"type": PACKET_RGB_COLOR, "value": ":".join(str(v) for v in value)}
-            )
+            await self._async_send_updates(self._color_update(value))
         except Exception as e:
             _LOGGER.error(f"Failed to set color for {self.unique_id}: {e}")
 
@@ -238,12 +269,7 @@ class ElementsBulb(APIBulb):
             return
 
         try:
-            await self._async_send_updates(
-                {
-                    "type": PACKET_COLOR_TEMP,
-                    "value": _encode_color_temp(temp_mireds, self.min_mireds, self.max_mireds),
-                }
-            )
+            await self._async_send_updates(self._temperature_update(temp_mireds))
         except Exception as e:
             _LOGGER.error(f"Failed to set color temperature for {self.unique_id}: {e}")
 
@@ -251,22 +277,66 @@ class ElementsBulb(APIBulb):
     async def set_effect(self, effect: str, enable: bool):
         """Set a special effect."""
         try:
-            await self._async_send_updates(
-                {"type": effect, "value": PACKET_VALUE_ON if enable else PACKET_VALUE_OFF}
-            )
+            await self._async_send_updates(self._effect_update(effect, enable))
         except Exception as e:
             _LOGGER.error(f"Failed to set effect {effect} for {self.unique_id}: {e}")
 
-    async def _async_send_updates(self, *messages: dict[str, Any]):
-        """Send updates to the light via MQTT."""
-        extras = {"dn": self.unique_id, "time": int(time.time() * 1000)}
+    async def set_state(
+        self,
+        power: bool | None = None,
+        brightness: int | None = None,
+        rgb: tuple[int, int, int] | None = None,
+        temp: int | None = None,
+        effect: str | None = None,
+    ) -> bool:
+        """Set several attributes with a single MQTT publish.
+
+        Unsupported attributes are skipped; an effect of "none" disables effects.
+        Returns whether the command was sent.
+        """
+        updates = []
+        try:
+            if power is not None:
+                updates.append(self._power_update(power))
+            if brightness is not None:
+                if self._supports_brightness:
+                    updates.append(self._brightness_update(brightness))
+                else:
+                    _LOGGER.warning(f"Brightness is not supported by {self.name}")
+            if rgb is not None:
+                if self._supports_color:
+                    updates.append(self._color_update(rgb))
+                else:
+                    _LOGGER.warning(f"Color is not supported by {self.name}")
+            if temp is not None:
+                if self._supports_color_temp:
+                    updates.append(self._temperature_update(temp))
+                else:
+                    _LOGGER.warning(f"Color temperature is not supported by {self.name}")
+            if effect is not None:
+                updates.append(self._effect_update(effect, effect != "none"))
+        except Exception as e:
+            _LOGGER.error(f"Failed to set state for {self.unique_id}: {e}")
+            return False
+
+        if updates:
+            return await self._async_send_updates(*updates)
+        return True
+
+    async def _async_send_updates(self, *messages: dict[str, Any]) -> bool:
+        """Send updates to the light via a single MQTT publish.
+
+        Messages are stamped in place, so callers must pass fresh dicts.
+        """
+        now = time.time_ns() // 1_000_000
+        for message in messages:
+            message["dn"] = self._unique_id
+            message["time"] = now
         try:
-            await self._api.async_mqtt_publish(
-                f"wifielement/{self.unique_id}/update",
-                [message | extras for message in messages],
-            )
+            return await self._api.async_mqtt_publish(self._update_topic, list(messages))
         except Exception as e:
             _LOGGER.error(f"Failed to send updates to light {self.unique_id}: {e}")
+            return False
 
     def update_bulb(self, payload: list[dict[str, Any]]):
         """Update the bulb's state based on the payload."""
@@ -276,7 +346,7 @@ class ElementsBulb(APIBulb):
                 if not item:
                     continue
                 packet[item["type"]] = item["value"]
-            _LOGGER.debug(f"Applying update to {self.name}: {packet}")
+            _LOGGER.debug("Applying update to %s: %s", self.name, packet)
             self._data.update(packet)
         except (KeyError, ValueError) as e:
             _LOGGER.warning(f"Failed to update bulb {self.unique_id}: {e}")
@@ -1,6 +1,7 @@
 """Sengled light platform."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -13,20 +14,34 @@ from homeassistant.components.light import (
     LightEntity,
     LightEntityFeature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_DEVICES
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from .api import ElementsBulb
+from .api.elements import PACKET_MODEL, PACKET_SW_VERSION
 from .const import ATTRIBUTION, DOMAIN, SUPPORTED_DEVICES
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _can_coalesce(state: dict[str, Any], following: dict[str, Any]) -> bool:
+    """Whether a queued command can be merged into the one before it.
+
+    Merging never crosses a turn off, so commands queued before and after it
+    keep their order.
+    """
+    return (state.get("power") is False) == (following.get("power") is False)
+
+
 class ElementsLightEntity(ElementsBulb, LightEntity):
     """Represents a Sengled light bulb that supports brightness, color, and temperature control dynamically."""
 
+    # _api and the other bulb attributes are already slots on ElementsBulb
+    __slots__ = ("_last_sent", "_status_count", "_cmd_queue", "_cmd_pending", "_state_args")
+
     _attr_attribution = ATTRIBUTION
     _attr_should_poll = False
 
@@ -34,68 +49,122 @@ class ElementsLightEntity(ElementsBulb, LightEntity):
         """Initialize a basic light entity."""
         super().__init__(discovery)
         self._api = api
+        # set_state() arguments the worker has sent since the last status update
+        self._last_sent: dict[str, Any] = {}
+        # Status updates received, so a send can tell one arrived meanwhile
+        self._status_count = 0
+        # Pending set_state() arguments, drained by _async_command_worker
+        self._cmd_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        # Commands queued or in flight, not yet handled by the worker
+        self._cmd_pending = 0
+        # The cloud may omit model or version, which must not break setup
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, self.unique_id)},
+            manufacturer="Sengled",
+            model=self._data.get(PACKET_MODEL),
+            sw_version=self._data.get(PACKET_SW_VERSION),
+        )
 
-        # Determine supported features from 'supportAttributes'
-        support_attributes = self._data.get("supportAttributes", "").split(",")
-        self._supports_brightness = "brightness" in support_attributes
-        self._supports_color = "color" in support_attributes
-        self._supports_color_temp = "colorTemperature" in support_attributes
+        # Capabilities are fixed at discovery, so resolve them once.
+        # Maps each supported turn_on attribute to its set_state() argument.
+        self._state_args = {ATTR_EFFECT: "effect"}
+        if self._supports_brightness:
+            self._state_args[ATTR_BRIGHTNESS] = "brightness"
+        if self._supports_color:
+            self._state_args[ATTR_RGB_COLOR] = "rgb"
+        if self._supports_color_temp:
+            self._state_args[ATTR_COLOR_TEMP] = "temp"
 
+        modes = set()
+        if self._supports_color_temp:
+            modes.add(ColorMode.COLOR_TEMP)
+        if self._supports_color:
+            modes.add(ColorMode.RGB)
+        if self._supports_brightness:
+            modes.add(ColorMode.BRIGHTNESS)
+        self._attr_supported_color_modes = frozenset(modes)
+        # TODO show effects only if available
+        self._attr_supported_features = (
+            LightEntityFeature.EFFECT if self._supports_color else LightEntityFeature(0)
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Start sending queued commands once the entity is added."""
+        await super().async_added_to_hass()
+        worker = self.hass.async_create_background_task(
+            self._async_command_worker(), f"Sengled {self.unique_id} commands"
+        )
+        self.async_on_remove(worker.cancel)
+
+    async def _async_command_worker(self) -> None:
+        """Send queued commands, coalescing bursts to the latest value per attribute."""
+        state = None
+        while True:
+            if state is None:
+                state = await self._cmd_queue.get()
+
+            # Slider drags queue many values while a command is in flight
+            handled = 1
+            following = None
+            while not self._cmd_queue.empty():
+                following = self._cmd_queue.get_nowait()
+                if not _can_coalesce(state, following):
+                    break
+                state.update(following)
+                handled += 1
+                following = None
+
+            try:
+                # A status arriving mid-send supersedes what was sent
+                status_count = self._status_count
+                if await self.set_state(**state) and status_count == self._status_count:
+                    self._last_sent.update(state)
+            except Exception:
+                _LOGGER.exception("Failed to send %s to %s", state, self.name)
+            self._cmd_pending -= handled
+            state = following
+
+    def _queue_command(self, state: dict[str, Any]) -> None:
+        """Queue set_state() arguments for the command worker."""
+        self._cmd_pending += 1
+        self._cmd_queue.put_nowait(state)
+
+    @callback
     def update_bulb(self, payload: dict) -> None:
-        """Update bulb state."""
+        """Update bulb state. Called by the API from within the event loop."""
         super().update_bulb(payload)
-        self.schedule_update_ha_state()
+        self._status_count += 1
+        self._last_sent.clear()
+        self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the light with optional attributes."""
         _LOGGER.debug("Turn on %s with attributes %r", self.name, kwargs)
+        # Commands are only redundant when nothing is queued or in flight and
+        # the bulb is on, going by its reported state plus what was sent since
+        settled = not self._cmd_pending and self._last_sent.get("power", self.is_on)
+
         if not kwargs:
-            await self.set_power(True)
-        if self._supports_brightness and ATTR_BRIGHTNESS in kwargs:
-            await self.set_brightness(kwargs[ATTR_BRIGHTNESS])
-        if self._supports_color and ATTR_RGB_COLOR in kwargs:
-            await self.set_color(kwargs[ATTR_RGB_COLOR])
-        if self._supports_color_temp and ATTR_COLOR_TEMP in kwargs:
-            await self.set_temperature(kwargs[ATTR_COLOR_TEMP])
-        if ATTR_EFFECT in kwargs:
-            effect = kwargs[ATTR_EFFECT]
-            enable = effect != "none"
-            await self.set_effect(effect, enable)
+            if not settled:
+                self._queue_command({"power": True})
+            return
+
+        # Collect everything so it goes out as one command
+        state_args = self._state_args
+        state = {state_args[attr]: value for attr, value in kwargs.items() if attr in state_args}
+        if settled:
+            state = {key: value for key, value in state.items() if self._last_sent.get(key) != value}
+        elif state:
+            # The bulb is off or may be turning off, so make sure it ends up on
+            state["power"] = True
+        if state:
+            self._queue_command(state)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the light."""
         _LOGGER.debug("Turn off %s with attributes %r", self.name, kwargs)
-        await self.set_power(False)
-
-    @property
-    def device_info(self) -> DeviceInfo | None:
-        """Return device information for Home Assistant."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.unique_id)},
-            manufacturer="Sengled",
-            model=self.model,
-            sw_version=self.sw_version,
-        )
-
-    @property
-    def supported_color_modes(self) -> set[ColorMode] | set[str] | None:
-        """Return supported color modes based on device capabilities."""
-        modes = set()
-        if self._supports_color_temp:
-            modes.add(ColorMode.COLOR_TEMP)
-        if self._supports_color:
-            modes.add(ColorMode.RGB)
-        if self._supports_brightness:
-            modes.add(ColorMode.BRIGHTNESS)
-        return modes
-
-    # TODO show effects only if available
-    @property
-    def supported_features(self) -> LightEntityFeature:
-        """Return supported features based on device capabilities."""
-        if self._supports_color:
-            return LightEntityFeature.EFFECT
-        return LightEntityFeature(0)
+        self._last_sent.clear()
+        self._queue_command({"power": False})
 
     def __repr__(self) -> str:
         """String representation for debugging purposes."""
@@ -107,17 +176,24 @@ class ElementsLightEntity(ElementsBulb, LightEntity):
         )
 
 
+# Entity class for each tested device type
+_TYPE_TO_CLS: dict[str, type[ElementsLightEntity]] = {
+    type_code: ElementsLightEntity for type_code in SUPPORTED_DEVICES
+}
+
+
 def pick_light(discovery: DiscoveryInfoType):
     """Select which light entity to use based on discovery info."""
-    try:
-        if discovery["typeCode"] in SUPPORTED_DEVICES:
-            return ElementsLightEntity
-    except KeyError:
+    type_code = discovery.get("typeCode")
+    if type_code is None:
         _LOGGER.error("Device type not found in discovery: %s", discovery)
         return None
 
-    _LOGGER.warning("%s Device Integration not tested, defaulting to generic Light.\nDetails : %s", discovery["typeCode"], discovery)
-    return ElementsLightEntity
+    light_cls = _TYPE_TO_CLS.get(type_code)
+    if light_cls is None:
+        _LOGGER.warning("%s Device Integration not tested, defaulting to generic Light.\nDetails : %s", type_code, discovery)
+        return ElementsLightEntity
+    return light_cls
 
 
 async def async_setup_platform(
@@ -127,14 +203,30 @@ async def async_setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up the Sengled platform."""
-    api = hass.data[DOMAIN]
-
-    light_cls = pick_light(discovery_info)
-    if not light_cls:
-        _LOGGER.error("No valid light class found for discovery: %s", discovery_info)
+    # Only discovery sets up lights
+    if discovery_info is None:
         return
 
-    light = light_cls(api, discovery_info)
-    await api.async_register_light(light)
-    add_entities([light])
-    _LOGGER.info("Discovered and set up light: %r", light)
+    # Every light shares the API's pooled HTTP session and single MQTT client
+    api = hass.data[DOMAIN]
+
+    lights = []
+    for discovery in discovery_info[CONF_DEVICES]:
+        # A malformed device must not stop the others from being set up
+        try:
+            light_cls = pick_light(discovery)
+            if not light_cls:
+                _LOGGER.error("No valid light class found for discovery: %s", discovery)
+                continue
+
+            light = light_cls(api, discovery)
+        except Exception:
+            _LOGGER.exception("Failed to set up light for discovery: %s", discovery)
+            continue
+
+        lights.append(light)
+        _LOGGER.info("Discovered light: %s (%s)", light.name, light.unique_id)
+
+    if lights:
+        await api.async_register_lights(lights)
+        add_entities(lights)
@@ -0,0 +1,83 @@
+import asyncio
+import contextlib
+import logging
+
+import orjson
+
+from ..api import API
+
+
+class FakeTopic:
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self):
+        return self.value
+
+
+class FakeMessage:
+    def __init__(self, topic, payload):
+        self.topic = FakeTopic(topic)
+        self.payload = payload
+
+
+class FakeClient:
+    """An MQTT client that replays a fixed list of messages."""
+
+    def __init__(self, messages):
+        self._messages = messages
+
+    @contextlib.asynccontextmanager
+    async def messages(self):
+        async def replay():
+            for message in self._messages:
+                yield message
+
+        yield replay()
+
+
+class FakeLight:
+    def __init__(self, unique_id):
+        self.unique_id = unique_id
+        self.mqtt_topics = (f"wifielement/{unique_id}/status",)
+        self.updates = []
+
+    def update_bulb(self, payload):
+        self.updates.append(payload)
+
+
+def run_message_loop(light, messages):
+    async def _run():
+        api = API(None, "user", "password")
+        try:
+            await api.async_register_lights([light])
+            api._mqtt = FakeClient(messages)
+            await api._message_loop()
+        finally:
+            await api._http.close()
+
+    asyncio.run(_run())
+
+
+def test_message_loop_dispatch(caplog):
+    light = FakeLight("80:A0:36:E1:7D:29")
+    status = [{"type": "switch", "value": "1"}]
+    messages = [
+        FakeMessage("wifielement/80:A0:36:E1:7D:29/status", orjson.dumps(status)),
+        FakeMessage("wifielement/80:A0:36:E1:7D:29/update", orjson.dumps(status)),
+        FakeMessage("otherelement/80:A0:36:E1:7D:29/status", b"[]"),
+        FakeMessage("wifielement/80:A0:36:E1:7D:29/status/extra", b"[]"),
+    ]
+
+    with caplog.at_level(logging.WARNING):
+        run_message_loop(light, messages)
+
+    assert light.updates == [status]
+    dropped = [
+        record.getMessage()
+        for record in caplog.records
+        if record.getMessage().startswith("Dropping unknown message")
+    ]
+    assert len(dropped) == 2
+    assert "otherelement/80:A0:36:E1:7D:29/status" in dropped[0]
+    assert "wifielement/80:A0:36:E1:7D:29/status/extra" in dropped[1]
@@ -0,0 +1,68 @@
+import asyncio
+
+from ..api import elements
+
+from .fixtures import bulbs
+from .fixtures.api import FakeAPI, sent_values
+
+
+def make_bulb(discovery, api=None):
+    bulb = elements.ElementsBulb(discovery)
+    bulb._api = api or FakeAPI()
+    return bulb
+
+
+def test_set_state_single_publish():
+    api = FakeAPI()
+    bulb = make_bulb(bulbs.BULB_W21N13, api)
+
+    assert asyncio.run(
+        bulb.set_state(power=True, brightness=255, rgb=(1, 2, 3), temp=400, effect="christmas")
+    )
+
+    assert len(api.published) == 1
+    topic, message = api.published[0]
+    assert topic == "wifielement/80:A0:36:E1:7D:29/update"
+    assert sent_values(api) == [
+        [
+            ("switch", "1"),
+            ("brightness", "100"),
+            ("color", "1:2:3"),
+            ("colorTemperature", "0"),
+            ("christmas", "1"),
+        ]
+    ]
+    assert {item["dn"] for item in message} == {"80:A0:36:E1:7D:29"}
+    assert len({item["time"] for item in message}) == 1
+
+
+def test_set_state_effect_none_disables():
+    api = FakeAPI()
+    bulb = make_bulb(bulbs.BULB_W21N13, api)
+
+    asyncio.run(bulb.set_state(effect="none"))
+
+    assert sent_values(api) == [[("none", "0")]]
+
+
+def test_set_state_skips_unsupported():
+    api = FakeAPI()
+    bulb = make_bulb(bulbs.BULB_W21N11, api)
+
+    asyncio.run(bulb.set_state(brightness=128, rgb=(1, 2, 3), temp=300))
+
+    assert sent_values(api) == [[("brightness", "51")]]
+
+
+def test_set_state_nothing_supported():
+    api = FakeAPI()
+    bulb = make_bulb(bulbs.BULB_W21N11, api)
+
+    assert asyncio.run(bulb.set_state(rgb=(1, 2, 3)))
+    assert api.published == []
+
+
+def test_set_state_reports_failed_publish():
+    bulb = make_bulb(bulbs.BULB_W21N13, FakeAPI(result=False))
+
+    assert not asyncio.run(bulb.set_state(power=False))
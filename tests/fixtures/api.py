@@ -0,0 +1,26 @@
+"""A stand-in for the API that records what would be published."""
+
+
+class FakeAPI:
+    """Records MQTT publishes instead of sending them."""
+
+    def __init__(self, result=True):
+        self.published = []
+        self.registered = []
+        self.result = result
+        # Called during a publish, to simulate a status arriving mid-send
+        self.on_publish = None
+
+    async def async_register_lights(self, lights):
+        self.registered.extend(lights)
+
+    async def async_mqtt_publish(self, topic, message):
+        self.published.append((topic, message))
+        if self.on_publish:
+            self.on_publish()
+        return self.result
+
+
+def sent_values(api):
+    """Return the (type, value) pairs of every recorded publish."""
+    return [[(item["type"], item["value"]) for item in message] for _, message in api.published]
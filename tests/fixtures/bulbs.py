@@ -53,7 +53,7 @@ BULB_W21N11HDL = {
   "deviceUuid": "80:A0:36:C7:3E:49",
   "category": "wifielement",
   "typeCode": "W31-N11HDL",
-  "deviceBleFlag": null,
+  "deviceBleFlag": None,
   "attributeList": [
     {"name": "brightness", "value": "70"},
     {"name": "consumptionTime", "value": "54910223"},
@@ -1,8 +1,15 @@
+import asyncio
+import contextlib
+from types import SimpleNamespace
+
 import pytest
+from homeassistant.const import CONF_DEVICES
 
 from .. import light
+from ..const import DOMAIN
 
 from .fixtures import bulbs
+from .fixtures.api import FakeAPI, sent_values
 
 
 def test_pick_light_default():
@@ -15,3 +22,146 @@ def test_pick_light_color_wifi():
 
 def test_pick_light_white_wifi():
     assert light.pick_light(bulbs.BULB_W21N11) is light.ElementsLightEntity
+
+
+def test_pick_light_untested_type():
+    assert light.pick_light({"typeCode": "W99-X00"}) is light.ElementsLightEntity
+
+
+def test_setup_skips_malformed_device():
+    api = FakeAPI()
+    hass = SimpleNamespace(data={DOMAIN: api})
+    added = []
+    broken = {key: value for key, value in bulbs.BULB_W21N11.items() if key != "deviceUuid"}
+
+    asyncio.run(
+        light.async_setup_platform(
+            hass, {}, added.extend, {CONF_DEVICES: [bulbs.BULB_W21N13, broken]}
+        )
+    )
+
+    assert [entity.unique_id for entity in added] == ["80:A0:36:E1:7D:29"]
+    assert api.registered == added
+
+
+async def send_commands(entity, *commands):
+    """Queue the given turn_on/turn_off calls, then let the worker drain them."""
+    for command, kwargs in commands:
+        await getattr(entity, command)(**kwargs)
+    worker = asyncio.ensure_future(entity._async_command_worker())
+    try:
+        await asyncio.wait_for(_drained(entity), timeout=1)
+    finally:
+        worker.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await worker
+
+
+async def _drained(entity):
+    while entity._cmd_pending:
+        await asyncio.sleep(0)
+
+
+def make_light(discovery, api, on=True):
+    """Create an entity; call from inside the loop so its queue binds to it."""
+    entity = light.ElementsLightEntity(api, discovery)
+    entity._data["switch"] = "1" if on else "0"
+    return entity
+
+
+def test_turn_off_then_on_keeps_order():
+    async def scenario():
+        entity = make_light(bulbs.BULB_W21N13, api)
+        await send_commands(
+            entity, ("async_turn_off", {}), ("async_turn_on", {"brightness": 128})
+        )
+
+    api = FakeAPI()
+    asyncio.run(scenario())
+
+    assert sent_values(api) == [
+        [("switch", "0")],
+        [("switch", "1"), ("brightness", "51")],
+    ]
+
+
+def test_turn_on_after_queued_off_is_sent():
+    async def scenario():
+        entity = make_light(bulbs.BULB_W21N13, api)
+        await send_commands(entity, ("async_turn_off", {}), ("async_turn_on", {}))
+
+    api = FakeAPI()
+    asyncio.run(scenario())
+
+    assert sent_values(api) == [[("switch", "0")], [("switch", "1")]]
+
+
+def test_turn_on_when_on_is_skipped():
+    async def scenario():
+        entity = make_light(bulbs.BULB_W21N13, api)
+        await send_commands(entity, ("async_turn_on", {}))
+
+    api = FakeAPI()
+    asyncio.run(scenario())
+
+    assert api.published == []
+
+
+def test_slider_burst_is_coalesced():
+    async def scenario():
+        entity = make_light(bulbs.BULB_W21N13, api)
+        await send_commands(
+            entity,
+            ("async_turn_on", {"brightness": 10}),
+            ("async_turn_on", {"brightness": 20}),
+            ("async_turn_on", {"brightness": 255}),
+        )
+
+    api = FakeAPI()
+    asyncio.run(scenario())
+
+    assert sent_values(api) == [[("switch", "1"), ("brightness", "100")]]
+
+
+def test_repeated_value_is_skipped_once_sent():
+    async def scenario():
+        entity = make_light(bulbs.BULB_W21N13, api)
+        await send_commands(entity, ("async_turn_on", {"brightness": 255}))
+        await send_commands(entity, ("async_turn_on", {"brightness": 255}))
+
+    api = FakeAPI()
+    asyncio.run(scenario())
+
+    assert sent_values(api) == [[("brightness", "100")]]
+
+
+def test_repeated_value_is_retried_after_failed_publish():
+    async def scenario():
+        entity = make_light(bulbs.BULB_W21N13, api)
+        await send_commands(entity, ("async_turn_on", {"brightness": 255}))
+        api.result = True
+        await send_commands(entity, ("async_turn_on", {"brightness": 255}))
+
+    api = FakeAPI(result=False)
+    asyncio.run(scenario())
+
+    assert sent_values(api) == [[("brightness", "100")], [("brightness", "100")]]
+
+
+def test_status_during_send_is_not_overwritten():
+    async def scenario():
+        entity = make_light(bulbs.BULB_W21N13, api)
+        entity.async_write_ha_state = lambda: None
+
+        def status_update():
+            api.on_publish = None
+            entity.update_bulb([{"type": "brightness", "value": "20"}])
+
+        api.on_publish = status_update
+        await send_commands(entity, ("async_turn_on", {"brightness": 255}))
+        await send_commands(entity, ("async_turn_on", {"brightness": 255}))
+
+    api = FakeAPI()
+    asyncio.run(scenario())
+
+    assert sent_values(api) == [[("brightness", "100")], [("brightness", "100")]]